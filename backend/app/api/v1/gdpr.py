@@ -3,7 +3,7 @@ GDPR and CCPA compliance endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, raiseload
 from pydantic import BaseModel, EmailStr
 from typing import Optional, Dict, Any
 import json
@@ -76,7 +76,13 @@ async def request_data_export(
         
         # Add videos if requested
         if request.request_type in ["full", "videos"]:
-            videos = db.query(Video).filter(Video.user_id == user.id).all()
+            # Load every video's frames in one IN query; block other lazy loads
+            videos = (
+                db.query(Video)
+                .options(selectinload(Video.frames), raiseload("*"))
+                .filter(Video.user_id == user.id)
+                .all()
+            )
             export_data["videos"] = []
             
             for video in videos:
@@ -85,20 +91,21 @@ async def request_data_export(
                     "filename": video.original_filename,
                     "upload_date": video.created_at.isoformat(),
                     "duration": video.duration,
-                    "processing_status": video.processing_status,
+                    "is_processed": video.is_processed,
+                    "processing_error": video.processing_error,
                     "metadata": video.video_metadata
                 }
                 
                 # Add frame data
-                frames = db.query(Frame).filter(Frame.video_id == video.id).all()
                 video_data["frames"] = [
                     {
                         "frame_id": frame.id,
+                        "frame_number": frame.frame_number,
                         "timestamp": frame.timestamp,
-                        "description": frame.description,
+                        "metadata": frame.frame_metadata,
                         "created_at": frame.created_at.isoformat() if frame.created_at else None
                     }
-                    for frame in frames
+                    for frame in video.frames
                 ]
                 
                 export_data["videos"].append(video_data)
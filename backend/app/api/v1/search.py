@@ -55,6 +55,25 @@ class TextSearchRequest(ValidatedSearchRequest):
 # Initialize embedding service
 embedding_service = EmbeddingService()
 
+# Frames served from /app/frames, cached until the directory changes
+FRAMES_DIR = "/app/frames"
+_frames_dir_cache: Dict[str, Any] = {"mtime": None, "names": frozenset()}
+
+def list_available_frames() -> frozenset:
+    """
+    Return the set of frame filenames on disk, relisting only when the directory changes
+    """
+    try:
+        mtime = os.stat(FRAMES_DIR).st_mtime_ns
+    except OSError:
+        return frozenset()
+    
+    if _frames_dir_cache["mtime"] != mtime:
+        _frames_dir_cache["names"] = frozenset(os.listdir(FRAMES_DIR))
+        _frames_dir_cache["mtime"] = mtime
+    
+    return _frames_dir_cache["names"]
+
 @router.post("/text", response_model=SearchResponse)
 async def search_by_text(
     request: TextSearchRequest,
@@ -83,12 +102,14 @@ async def search_by_text(
         # Skip user statistics for demo mode
         
         # Convert frame paths to URLs
+        available_frames = list_available_frames()
+        
         def map_frame_path_to_actual_file(frame_path: str) -> str:
             """Map database frame path to actual file name"""
             basename = os.path.basename(frame_path)
             
             # Check if file exists as-is first
-            if os.path.exists(f"/app/frames/{basename}"):
+            if basename in available_frames:
                 return basename
             
             # Try mapping old naming convention to new
@@ -97,19 +118,19 @@ async def search_by_text(
                 frame_num = basename.split('_')[-1].replace('.jpg', '')
                 actual_frame_num = str(int(frame_num) - 1).zfill(3)
                 mapped_name = f"drive_01_frame_{actual_frame_num}.jpg"
-                if os.path.exists(f"/app/frames/{mapped_name}"):
+                if mapped_name in available_frames:
                     return mapped_name
             elif 'driving_camera_gh010002' in basename:
                 frame_num = basename.split('_')[-1].replace('.jpg', '')
                 actual_frame_num = str(int(frame_num) - 1).zfill(3)
                 mapped_name = f"drive_02_frame_{actual_frame_num}.jpg"
-                if os.path.exists(f"/app/frames/{mapped_name}"):
+                if mapped_name in available_frames:
                     return mapped_name
             elif 'driving_camera_gh010003' in basename:
                 frame_num = basename.split('_')[-1].replace('.jpg', '')
                 actual_frame_num = str(int(frame_num) - 1).zfill(3)
                 mapped_name = f"drive_03_frame_{actual_frame_num}.jpg"
-                if os.path.exists(f"/app/frames/{mapped_name}"):
+                if mapped_name in available_frames:
                     return mapped_name
             
             # Return original if no mapping works
@@ -203,7 +203,8 @@ async def list_videos(
         query = query.filter(Video.is_processed == True)
     
     total = query.count()
-    videos = query.offset(skip).limit(limit).all()
+    # Newest first; served by idx_videos_user_created for a user's own videos
+    videos = query.order_by(Video.created_at.desc()).offset(skip).limit(limit).all()
     
     return VideoListResponse(
         videos=[VideoResponse.model_validate(video) for video in videos],
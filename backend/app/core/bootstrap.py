@@ -0,0 +1,21 @@
+"""
+Event loop bootstrap for RareSift
+
+Sets the uvloop event loop policy, which only affects loops created after
+this import (asyncio.run in scripts and background tasks). Under uvicorn
+the app is imported inside an already-running loop, so the server loop is
+chosen by its own flag:
+    uvicorn app.main:app --loop uvloop --http httptools
+"""
+
+import asyncio
+
+# Try to import uvloop, keep the default asyncio loop if not available
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+if HAS_UVLOOP:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -2,61 +2,156 @@
 Redis caching configuration for RareSift
 """
 
-import redis
-from typing import Optional, Any
-import json
-import pickle
+import redis.asyncio as aioredis
+from typing import Optional, Any, Dict, List, Union
+import numpy as np
+import orjson
+import zstandard as zstd
 from app.core.config import settings
 
+ZSTD_LEVEL = 3
+MAX_CONNECTIONS = 50
+
+# Key prefixes, kept as bytes so building a key is a single concatenation
+SEARCH_PREFIX = b"search:"
+VIDEO_META_PREFIX = b"video_meta:"
+
+def _key(prefix: bytes, suffix: str) -> bytes:
+    """Build a cache key from a precomputed prefix"""
+    return prefix + suffix.encode()
+
+def _json_default(value: Any) -> Any:
+    """Encode types orjson has no native support for as str()"""
+    return str(value)
+
 class CacheManager:
     def __init__(self):
-        self.redis_client = redis.Redis(
-            host=settings.redis_host,
-            port=settings.redis_port,
-            db=settings.redis_db,
+        self.pool = aioredis.ConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=MAX_CONNECTIONS,
             decode_responses=False
         )
+        self.redis_client = aioredis.Redis(connection_pool=self.pool)
+        self._compressor = zstd.ZstdCompressor(level=ZSTD_LEVEL)
+        self._decompressor = zstd.ZstdDecompressor()
     
-    def get(self, key: str) -> Optional[Any]:
+    def _serialize(self, value: Any) -> bytes:
+        """
+        Encode a value as zstd-compressed JSON bytes.
+        Values round-trip as JSON, not pickle: tuples come back as lists, dict
+        keys as strings, datetimes as ISO-format strings, UUIDs as strings,
+        numpy arrays as lists and other objects as their str() form.
+        """
+        data = orjson.dumps(
+            value,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+        return self._compressor.compress(data)
+    
+    def _deserialize(self, data: bytes) -> Any:
+        """Decode bytes written by _serialize"""
+        return orjson.loads(self._decompressor.decompress(data))
+    
+    async def get(self, key: Union[str, bytes]) -> Optional[Any]:
         """Get value from cache"""
         try:
-            data = self.redis_client.get(key)
+            data = await self.redis_client.get(key)
             if data:
-                return pickle.loads(data)
+                return self._deserialize(data)
             return None
         except Exception:
             return None
     
-    def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+    async def set(self, key: Union[str, bytes], value: Any, ttl: int = 3600) -> bool:
         """Set value in cache with TTL"""
         try:
-            serialized = pickle.dumps(value)
-            return self.redis_client.setex(key, ttl, serialized)
+            serialized = self._serialize(value)
+            return await self.redis_client.setex(key, ttl, serialized)
+        except Exception:
+            return False
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one round trip"""
+        try:
+            raw = await self.redis_client.mget(keys)
+            return [self._deserialize(data) if data else None for data in raw]
+        except Exception:
+            return [None] * len(keys)
+    
+    async def set_many(self, values: Dict[str, Any], ttl: int = 3600) -> bool:
+        """Set several values with the same TTL in one round trip"""
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.setex(key, ttl, self._serialize(value))
+                await pipe.execute()
+            return True
         except Exception:
             return False
     
-    def delete(self, key: str) -> bool:
+    async def set_embedding(self, key: Union[str, bytes], embedding: np.ndarray, ttl: int = 3600) -> bool:
+        """Cache an embedding as raw float16 bytes, half the size of float32"""
+        try:
+            data = np.asarray(embedding, dtype=np.float16).tobytes()
+            return await self.redis_client.setex(key, ttl, data)
+        except Exception:
+            return False
+    
+    async def get_embedding(self, key: Union[str, bytes]) -> Optional[np.ndarray]:
+        """Get a cached embedding back as float32"""
+        try:
+            data = await self.redis_client.get(key)
+            if data:
+                return np.frombuffer(data, dtype=np.float16).astype(np.float32)
+            return None
+        except Exception:
+            return None
+    
+    async def set_embeddings(self, embeddings: Dict[Union[str, bytes], np.ndarray], ttl: int = 3600) -> bool:
+        """Cache several embeddings in one round trip"""
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, embedding in embeddings.items():
+                    pipe.setex(key, ttl, np.asarray(embedding, dtype=np.float16).tobytes())
+                await pipe.execute()
+            return True
+        except Exception:
+            return False
+    
+    async def get_embeddings(self, keys: List[Union[str, bytes]]) -> List[Optional[np.ndarray]]:
+        """Get several cached embeddings with a single MGET"""
+        try:
+            raw = await self.redis_client.mget(keys)
+            return [
+                np.frombuffer(data, dtype=np.float16).astype(np.float32) if data else None
+                for data in raw
+            ]
+        except Exception:
+            return [None] * len(keys)
+    
+    async def delete(self, key: str) -> bool:
         """Delete key from cache"""
         try:
-            return bool(self.redis_client.delete(key))
+            return bool(await self.redis_client.delete(key))
         except Exception:
             return False
     
-    def get_search_results(self, query_hash: str) -> Optional[dict]:
+    async def get_search_results(self, query_hash: str) -> Optional[dict]:
         """Get cached search results"""
-        return self.get(f"search:{query_hash}")
+        return await self.get(_key(SEARCH_PREFIX, query_hash))
     
-    def cache_search_results(self, query_hash: str, results: dict, ttl: int = 1800):
+    async def cache_search_results(self, query_hash: str, results: dict, ttl: int = 1800):
         """Cache search results for 30 minutes"""
-        return self.set(f"search:{query_hash}", results, ttl)
+        return await self.set(_key(SEARCH_PREFIX, query_hash), results, ttl)
     
-    def get_video_metadata(self, video_id: str) -> Optional[dict]:
+    async def get_video_metadata(self, video_id: str) -> Optional[dict]:
         """Get cached video metadata"""
-        return self.get(f"video_meta:{video_id}")
+        return await self.get(_key(VIDEO_META_PREFIX, str(video_id)))
     
-    def cache_video_metadata(self, video_id: str, metadata: dict, ttl: int = 3600):
+    async def cache_video_metadata(self, video_id: str, metadata: dict, ttl: int = 3600):
         """Cache video metadata for 1 hour"""
-        return self.set(f"video_meta:{video_id}", metadata, ttl)
+        return await self.set(_key(VIDEO_META_PREFIX, str(video_id)), metadata, ttl)
 
 # Global cache instance
 cache = CacheManager()
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -19,6 +19,12 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Create Base class for models
 Base = declarative_base()
 
+# Candidate list bounds for pgvector approximate search; 1000 is pgvector's hnsw.ef_search maximum
+VECTOR_SEARCH_EF_MIN = 100
+VECTOR_SEARCH_EF_MAX = 1000
+VECTOR_SEARCH_CANDIDATES_PER_RESULT = 10
+IVFFLAT_PROBES = 10
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -28,4 +34,23 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+
+def configure_vector_search(db: Session, limit: int) -> None:
+    """
+    Widen pgvector's approximate index search for the current transaction.
+    The index picks ef_search (HNSW) or probes-worth (IVFFlat) candidates before
+    the video filters and similarity threshold run, so size it well above LIMIT.
+    """
+    ef_search = min(
+        VECTOR_SEARCH_EF_MAX,
+        max(VECTOR_SEARCH_EF_MIN, limit * VECTOR_SEARCH_CANDIDATES_PER_RESULT)
+    )
+    db.execute(
+        text(
+            "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+            "set_config('ivfflat.probes', :probes, true)"
+        ),
+        {"ef_search": str(ef_search), "probes": str(IVFFLAT_PROBES)}
+    )
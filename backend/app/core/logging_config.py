@@ -5,6 +5,7 @@ Supports structured JSON logging, log rotation, and external log shipping
 
 import logging
 import logging.config
+import re
 import sys
 from pathlib import Path
 from typing import Dict, Any
@@ -161,6 +162,14 @@ def get_standard_logging_config(log_level: str, log_dir: str) -> Dict[str, Any]:
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
     
+    # Standard LogRecord attributes, excluded from the extra fields
+    RESERVED_ATTRS = frozenset([
+        'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
+        'module', 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+        'thread', 'threadName', 'processName', 'process', 'getMessage', 'exc_info',
+        'exc_text', 'stack_info'
+    ])
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
         
@@ -183,12 +192,7 @@ class JSONFormatter(logging.Formatter):
         
         # Add extra fields from LogRecord
         for key, value in record.__dict__.items():
-            if key not in [
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
-                'module', 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                'thread', 'threadName', 'processName', 'process', 'getMessage', 'exc_info',
-                'exc_text', 'stack_info'
-            ]:
+            if key not in self.RESERVED_ATTRS:
                 log_data[key] = value
         
         return json.dumps(log_data, default=str)
@@ -210,16 +214,20 @@ class SensitiveDataFilter(logging.Filter):
         'auth', 'bearer', 'api_key', 'access_token'
     ]
     
+    # All patterns matched in a single case-insensitive pass
+    SENSITIVE_REGEX = re.compile(
+        '|'.join(re.escape(pattern) for pattern in SENSITIVE_PATTERNS),
+        re.IGNORECASE
+    )
+    
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter sensitive data from log message"""
-        message = record.getMessage().lower()
+        match = self.SENSITIVE_REGEX.search(record.getMessage())
         
-        for pattern in self.SENSITIVE_PATTERNS:
-            if pattern in message:
-                # Replace the entire message with a warning
-                record.msg = f"[REDACTED] Log message contained sensitive data (pattern: {pattern})"
-                record.args = ()
-                break
+        if match:
+            # Replace the entire message with a warning
+            record.msg = f"[REDACTED] Log message contained sensitive data (pattern: {match.group(0).lower()})"
+            record.args = ()
         
         return True
 
@@ -85,7 +85,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         Add security headers to response
         """
         # Add request start time for performance monitoring
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Process request
         response = await call_next(request)
@@ -96,18 +96,20 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 if value:  # Only add non-empty headers
                     response.headers[header] = value
         
-        # Add performance header for monitoring
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+        # Add performance header for monitoring, in milliseconds
+        process_time = (time.perf_counter_ns() - start_ns) / 1e9
+        response.headers["X-Process-Time"] = f"{process_time * 1000:.2f}"
         
         # Log security-relevant requests
         if request.method in ["POST", "PUT", "DELETE", "PATCH"]:
             logger.info(
-                f"Security Log: {request.method} {request.url.path} "
-                f"from {request.client.host if request.client else 'unknown'} "
-                f"User-Agent: {request.headers.get('user-agent', 'unknown')[:100]} "
-                f"Status: {response.status_code} "
-                f"Time: {process_time:.3f}s"
+                "Security Log: %s %s from %s User-Agent: %s Status: %s Time: %.3fs",
+                request.method,
+                request.url.path,
+                request.client.host if request.client else 'unknown',
+                request.headers.get('user-agent', 'unknown')[:100],
+                response.status_code,
+                process_time
             )
         
         return response
@@ -168,7 +170,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         client_id = self._get_client_id(request)
         
         if self._is_rate_limited(client_id):
-            logger.warning(f"Rate limit exceeded for client: {client_id}")
+            logger.warning("Rate limit exceeded for client: %s", client_id)
             return StarletteResponse(
                 content="Rate limit exceeded",
                 status_code=429,
@@ -196,9 +198,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # Log request
         client_host = request.client.host if request.client else "unknown"
         logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {client_host} "
-            f"User-Agent: {request.headers.get('user-agent', 'unknown')[:100]}"
+            "Request: %s %s from %s User-Agent: %s",
+            request.method,
+            request.url.path,
+            client_host,
+            request.headers.get('user-agent', 'unknown')[:100]
         )
         
         # Process request
@@ -207,9 +211,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # Log response
         process_time = time.time() - start_time
         logger.info(
-            f"Response: {response.status_code} "
-            f"Time: {process_time:.3f}s "
-            f"Size: {response.headers.get('content-length', 'unknown')}"
+            "Response: %s Time: %.3fs Size: %s",
+            response.status_code,
+            process_time,
+            response.headers.get('content-length', 'unknown')
         )
         
         return response
\ No newline at end of file
@@ -3,6 +3,7 @@ Production monitoring and observability for RareSift
 Includes Prometheus metrics, structured logging, and health checks
 """
 
+import asyncio
 import time
 import logging
 import json
@@ -454,21 +455,39 @@ class HealthCheck:
             
             # Check upload directory
             upload_dir = '/app/uploads'
-            upload_dir_exists = os.path.exists(upload_dir) and os.path.isdir(upload_dir)
+            upload_dir_exists = os.path.isdir(upload_dir)
             upload_dir_writable = os.access(upload_dir, os.W_OK) if upload_dir_exists else False
             
-            # Check video processing status
-            total_videos = db.execute(text("SELECT COUNT(*) FROM videos")).scalar()
-            processing_videos = db.execute(text("SELECT COUNT(*) FROM videos WHERE processing_started_at IS NOT NULL AND processing_completed_at IS NULL")).scalar()
-            completed_videos = db.execute(text("SELECT COUNT(*) FROM videos WHERE is_processed = true")).scalar()
-            failed_videos = db.execute(text("SELECT COUNT(*) FROM videos WHERE processing_error IS NOT NULL")).scalar()
-            
-            # Check embedding generation status
-            total_frames = db.execute(text("SELECT COUNT(*) FROM frames")).scalar()
-            embedded_frames = db.execute(text("SELECT COUNT(*) FROM frames WHERE embedding IS NOT NULL")).scalar()
+            # Check video processing and embedding generation status in one round-trip
+            counts = db.execute(text("""
+                SELECT
+                    v.total_videos, v.processing_videos, v.completed_videos, v.failed_videos,
+                    f.total_frames, f.embedded_frames
+                FROM (
+                    SELECT
+                        COUNT(*) AS total_videos,
+                        COUNT(*) FILTER (WHERE processing_started_at IS NOT NULL AND processing_completed_at IS NULL) AS processing_videos,
+                        COUNT(*) FILTER (WHERE is_processed = true) AS completed_videos,
+                        COUNT(*) FILTER (WHERE processing_error IS NOT NULL) AS failed_videos
+                    FROM videos
+                ) v
+                CROSS JOIN (
+                    SELECT
+                        COUNT(*) AS total_frames,
+                        COUNT(embedding) AS embedded_frames
+                    FROM frames
+                ) f
+            """)).one()
             
             db.close()
             
+            total_videos = counts.total_videos
+            processing_videos = counts.processing_videos
+            completed_videos = counts.completed_videos
+            failed_videos = counts.failed_videos
+            total_frames = counts.total_frames
+            embedded_frames = counts.embedded_frames
+            
             # Calculate health status
             issues = []
             if not upload_dir_exists:
@@ -537,10 +556,17 @@ class HealthCheck:
         for name, check_func in self.checks.items():
             checks_to_run.append((name, check_func))
         
-        # Run all checks
-        for check_name, check_func in checks_to_run:
+        # Run all checks concurrently so the OpenAI round-trips overlap
+        check_results = await asyncio.gather(
+            *(check_func() for _, check_func in checks_to_run),
+            return_exceptions=True
+        )
+        
+        for (check_name, _), result in zip(checks_to_run, check_results):
             try:
-                result = await check_func()
+                if isinstance(result, BaseException):
+                    raise result
+                
                 results['checks'][check_name] = result
                 
                 # Update overall status
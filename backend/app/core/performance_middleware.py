@@ -1,5 +1,7 @@
 """
 Performance monitoring middleware for RareSift
+
+Run with: uvicorn app.main:app --loop uvloop --http httptools
 """
 
 import time
@@ -14,48 +16,36 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, slow_request_threshold: float = 1.0):
         super().__init__(app)
         self.slow_request_threshold = slow_request_threshold
+        self.slow_request_threshold_ns = int(slow_request_threshold * 1_000_000_000)
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Add request ID for tracing
-        request_id = f"{int(start_time * 1000000)}"
+        request_id = str(time.time_ns() // 1000)
         
         response = await call_next(request)
         
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        # Milliseconds, same header and unit as SecurityHeadersMiddleware
+        response.headers["X-Process-Time"] = f"{elapsed_ns / 1e6:.2f}"
         response.headers["X-Request-ID"] = request_id
         
+        # Add query count header when a query tracker populated it
+        if hasattr(request.state, 'query_count'):
+            response.headers["X-DB-Query-Count"] = str(request.state.query_count)
+        
         # Log slow requests
-        if process_time > self.slow_request_threshold:
+        if elapsed_ns > self.slow_request_threshold_ns:
             logger.warning(
-                f"Slow request: {request.method} {request.url.path} "
-                f"took {process_time:.3f}s (threshold: {self.slow_request_threshold}s)"
+                "Slow request: %s %s took %.3fs (threshold: %ss)",
+                request.method, request.url.path, elapsed_ns / 1e9, self.slow_request_threshold
             )
         
         # Log request metrics
         logger.info(
-            f"{request.method} {request.url.path} - "
-            f"{response.status_code} - {process_time:.3f}s"
+            "%s %s - %s - %.3fs",
+            request.method, request.url.path, response.status_code, elapsed_ns / 1e9
         )
         
         return response
-
-class DatabaseQueryMiddleware(BaseHTTPMiddleware):
-    """Middleware to track database query performance"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # This would integrate with SQLAlchemy to track query counts and times
-        # Implementation depends on your database setup
-        
-        query_start = time.time()
-        response = await call_next(request)
-        query_time = time.time() - query_start
-        
-        # Add query performance headers (for development)
-        if hasattr(request.state, 'query_count'):
-            response.headers["X-DB-Query-Count"] = str(request.state.query_count)
-            response.headers["X-DB-Query-Time"] = str(query_time)
-        
-        return response
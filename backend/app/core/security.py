@@ -36,6 +36,9 @@ MAX_FILE_SIZES = {
     'image': 10 * 1024 * 1024,   # 10MB
 }
 
+# Path separators, reserved and control characters replaced in filenames
+UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
 class FileSecurityValidator:
     """Secure file validation utilities"""
     
@@ -57,7 +60,7 @@ class FileSecurityValidator:
             
         # Remove path separators and dangerous characters
         filename = os.path.basename(filename)
-        filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+        filename = UNSAFE_FILENAME_CHARS.sub('_', filename)
         
         # Limit filename length
         if len(filename) > 255:
@@ -245,7 +248,7 @@ def secure_delete_file(file_path: str, base_dir: str) -> bool:
         # Validate path is within base directory
         safe_path = sanitize_path(file_path, base_dir)
         
-        if os.path.exists(safe_path) and os.path.isfile(safe_path):
+        if os.path.isfile(safe_path):
             os.remove(safe_path)
             return True
         return False
@@ -263,12 +266,13 @@ def secure_delete_directory_contents(directory: str, pattern: str, base_dir: str
         # Validate directory path
         safe_dir = sanitize_path(directory, base_dir)
         
-        if not os.path.exists(safe_dir) or not os.path.isdir(safe_dir):
+        if not os.path.isdir(safe_dir):
             return 0
             
         # List files matching pattern
+        matches_pattern = re.compile(pattern).match
         for filename in os.listdir(safe_dir):
-            if re.match(pattern, filename):
+            if matches_pattern(filename):
                 file_path = os.path.join(safe_dir, filename)
                 if secure_delete_file(file_path, base_dir):
                     deleted_count += 1
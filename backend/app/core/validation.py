@@ -24,6 +24,18 @@ PATTERNS = {
     'username': re.compile(r'^[a-zA-Z0-9_\-]{3,50}$'),
 }
 
+# Null bytes and non-printable control characters stripped from all input
+CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]')
+
+# Potential SQL injection patterns, fused so each query is scanned once
+SQL_INJECTION_PATTERN = re.compile(
+    r'\b(union|select|insert|update|delete|drop|create|alter|exec|execute)\b'
+    r'|[\'";]'   # Common SQL injection characters
+    r'|--'        # SQL comments
+    r'|/\*|\*/',  # SQL block comments
+    re.IGNORECASE
+)
+
 # Maximum lengths for different field types
 MAX_LENGTHS = {
     'search_query': 500,
@@ -65,8 +77,7 @@ class InputSanitizer:
         text = html.escape(text)
         
         # Remove null bytes and control characters
-        text = text.replace('\x00', '')
-        text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+        text = CONTROL_CHARS_PATTERN.sub('', text)
         
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -101,16 +112,8 @@ class InputSanitizer:
             raise HTTPException(status_code=400, detail="Search query must be at least 2 characters")
         
         # Check for potential SQL injection patterns
-        sql_patterns = [
-            r'\b(union|select|insert|update|delete|drop|create|alter|exec|execute)\b',
-            r'[\'";]',  # Common SQL injection characters
-            r'--',      # SQL comments
-            r'/\*|\*/', # SQL block comments
-        ]
-        
-        for pattern in sql_patterns:
-            if re.search(pattern, sanitized.lower()):
-                raise HTTPException(status_code=400, detail="Invalid characters in search query")
+        if SQL_INJECTION_PATTERN.search(sanitized):
+            raise HTTPException(status_code=400, detail="Invalid characters in search query")
         
         return sanitized
     
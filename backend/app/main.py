@@ -1,4 +1,5 @@
 import os
+from app.core import bootstrap  # noqa: F401  uvloop policy for loops created after startup
 from fastapi import FastAPI, HTTPException, Request
 
 # Configuration for Render deployment
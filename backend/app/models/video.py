@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
@@ -33,7 +33,7 @@ class Video(Base):
     processing_error = Column(Text, nullable=True)
     
     # User association for multi-tenancy
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # Indexed by idx_videos_user_created
     
     # Timestamps
     created_at = Column(DateTime, default=func.now())
@@ -44,6 +44,15 @@ class Video(Base):
     user = relationship("User", back_populates="videos")
 
 
+# A user's videos newest-first without a sort; is_processed filter answered from the index
+Index(
+    "idx_videos_user_created",
+    Video.user_id,
+    Video.created_at.desc(),
+    postgresql_include=["is_processed"]
+)
+
+
 class Frame(Base):
     __tablename__ = "frames"
 
@@ -67,6 +76,10 @@ class Frame(Base):
     embedding = relationship("Embedding", back_populates="frame", uselist=False)
 
 
+# Frames of a video in timestamp order as a single range scan
+Index("idx_frames_video_timestamp", Frame.video_id, Frame.timestamp)
+
+
 class Embedding(Base):
     __tablename__ = "embeddings"
 
@@ -107,6 +120,16 @@ class Search(Base):
     created_at = Column(DateTime, default=func.now())
 
 
+# Searches are append-only, so created_at follows physical order and a
+# block-range index answers the time-window stats at a fraction of a B-tree's size
+Index(
+    "idx_searches_created_brin",
+    Search.created_at,
+    postgresql_using="brin",
+    postgresql_with={"pages_per_range": 32}
+)
+
+
 class Export(Base):
     __tablename__ = "exports"
 
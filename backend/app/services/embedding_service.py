@@ -11,6 +11,7 @@ import asyncio
 import hashlib
 
 from app.core.config import settings
+from app.core.database import configure_vector_search
 from app.models.video import Frame, Embedding, Search
 
 
@@ -276,6 +277,7 @@ class EmbeddingService:
             """)
             
             # Execute the query
+            configure_vector_search(db, limit)
             result = db.execute(raw_query, {
                 "query_vector": query_vector,
                 "similarity_threshold": similarity_threshold,
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from collections import defaultdict, deque
 
 from app.core.config import settings
+from app.core.database import configure_vector_search
 from app.models.video import Frame, Search
 
 # Try to import OpenAI, fall back to requests if not available
@@ -566,6 +567,7 @@ class OpenAIEmbeddingService:
             """)
             
             # Execute the query
+            configure_vector_search(db, limit)
             result = db.execute(raw_query, {
                 "query_vector": query_vector,
                 "similarity_threshold": similarity_threshold,
@@ -85,9 +85,21 @@ class VideoProcessor:
             sample_points = self._calculate_sample_points(duration, target_frames)
             print(f"DEBUG: Sample points (seconds): {[f'{p:.1f}' for p in sample_points]}")
             
+            # Frames extracted from this exact source file are reused on re-runs
+            video_stat = os.stat(video_path)
+            
             # Extract frames at calculated points
             for i, timestamp in enumerate(sample_points):
                 frame_number = int(timestamp * fps)
+                frame_path = self._sampled_frame_path(video_id, video_stat, frame_number)
+                
+                if self._is_frame_fresh(frame_path, video_stat.st_mtime):
+                    frames_data.append({
+                        "frame_number": i,
+                        "timestamp": timestamp,
+                        "frame_path": frame_path
+                    })
+                    continue
                 
                 # Seek to specific frame
                 cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
@@ -100,9 +112,6 @@ class VideoProcessor:
                 print(f"DEBUG: Extracting frame {i} at timestamp {timestamp:.2f}s (frame {frame_number})")
                 
                 # Save frame as image
-                frame_filename = f"video_{video_id}_frame_{i:06d}.jpg"
-                frame_path = os.path.join(settings.upload_dir, "frames", frame_filename)
-                
                 # Convert BGR to RGB for saving
                 frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
                 image = Image.fromarray(frame_rgb)
@@ -123,6 +132,25 @@ class VideoProcessor:
             cap.release()
             raise Exception(f"Failed to extract frames with smart sampling: {str(e)}")
     
+    def _sampled_frame_path(self, video_id: int, video_stat: os.stat_result, frame_number: int) -> str:
+        """
+        Path for a seek-sampled frame, keyed by the source file's size and
+        mtime and by its source frame number, so a reused file always comes
+        from this video even if the database ids were reset and reissued
+        """
+        source_key = f"{video_stat.st_size}-{video_stat.st_mtime_ns}"
+        frame_filename = f"video_{video_id}_src{source_key}_frame_{frame_number:08d}.jpg"
+        return os.path.join(settings.upload_dir, "frames", frame_filename)
+    
+    def _is_frame_fresh(self, frame_path: str, video_mtime: float) -> bool:
+        """
+        Check if a previously extracted frame is newer than its source video
+        """
+        try:
+            return os.stat(frame_path).st_mtime > video_mtime
+        except OSError:
+            return False
+    
     def _calculate_sample_points(self, duration: float, target_frames: int) -> List[float]:
         """
         Calculate strategic sampling points for optimal coverage
@@ -325,9 +353,21 @@ class VideoProcessor:
             
             print(f"DEBUG: Extracting {len(sample_times)} frames at: {[f'{t:.1f}s' for t in sample_times[:5]]}{'...' if len(sample_times) > 5 else ''}")
             
+            # Frames extracted from this exact source file are reused on re-runs
+            video_stat = os.stat(video_path)
+            
             # Extract frames at calculated times
             for i, timestamp in enumerate(sample_times):
                 frame_number = int(timestamp * fps)
+                frame_path = self._sampled_frame_path(video_id, video_stat, frame_number)
+                
+                if self._is_frame_fresh(frame_path, video_stat.st_mtime):
+                    frames_data.append({
+                        "frame_number": i,
+                        "timestamp": timestamp,
+                        "frame_path": frame_path
+                    })
+                    continue
                 
                 cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
                 ret, frame = cap.read()
@@ -336,9 +376,6 @@ class VideoProcessor:
                     continue
                 
                 # Save frame
-                frame_filename = f"video_{video_id}_frame_{i:06d}.jpg"
-                frame_path = os.path.join(settings.upload_dir, "frames", frame_filename)
-                
                 frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
                 image = Image.fromarray(frame_rgb)
                 image.save(frame_path, "JPEG", quality=90)
@@ -183,7 +183,14 @@ def export_frames_task(self, export_id: int):
         
         # Get frame data
         from app.models.video import Frame
-        frames = db.query(Frame).filter(Frame.id.in_(frame_ids)).all()
+        from sqlalchemy.orm import joinedload, raiseload
+        # Many-to-one, so join the video in instead of loading it per frame
+        frames = (
+            db.query(Frame)
+            .options(joinedload(Frame.video), raiseload("*"))
+            .filter(Frame.id.in_(frame_ids))
+            .all()
+        )
         
         if not frames:
             raise Exception("No frames found for export")
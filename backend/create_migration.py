@@ -6,13 +6,190 @@ Creates all tables directly without needing Alembic migrations
 
 import os
 import sys
+import time
 sys.path.append(os.path.dirname(__file__))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import Column, Index, MetaData, Table, create_engine, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateIndex
+from pgvector.sqlalchemy import Vector
 from app.core.config import settings
 from app.core.database import Base
 from app.models.video import Video, Frame, Embedding, Search, Export
 
+# Give up on a lock quickly instead of queueing behind live traffic
+INDEX_LOCK_TIMEOUT = "3s"
+INDEX_BUILD_ATTEMPTS = 3
+LOCK_NOT_AVAILABLE = "55P03"
+# Indexes left on existing databases by older models, and the index that replaced each
+SUPERSEDED_INDEXES = {
+    "ix_videos_user_id": "idx_videos_user_created",
+}
+
+# Similarity search orders frames.embedding by cosine distance. That column is
+# added outside the models (simple_production_import.py), so its index lives here
+# rather than on the model, where create_all would fail on pgvector < 0.5
+frame_vectors = Table("frames", MetaData(), Column("embedding", Vector(1536)))
+FRAME_VECTOR_INDEXES = ("idx_frames_embedding_hnsw", "idx_frames_embedding_ivfflat")
+HNSW_MIN_PGVECTOR = (0, 5)
+IVFFLAT_ROWS_PER_LIST = 1000
+# Below this many embedded frames an exact scan is fast and returns every match;
+# an approximate index would only trade recall for nothing
+VECTOR_INDEX_MIN_ROWS = 100_000
+
+# HNSW builds slow down sharply once the graph no longer fits in maintenance_work_mem.
+# Unset keeps the server default; only raise it on a database with RAM to spare
+INDEX_MAINTENANCE_WORK_MEM = os.environ.get("INDEX_MAINTENANCE_WORK_MEM")
+
+def _first_line(error):
+    """Short form of a database error for progress output"""
+    return str(getattr(error, "orig", error)).splitlines()[0]
+
+def _index_is_valid(conn, name):
+    """
+    True if the index exists and is valid, False if a failed or interrupted
+    concurrent build left it INVALID, None if it does not exist
+    """
+    return conn.execute(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name}
+    ).scalar()
+
+def _drop_index_concurrently(conn, name):
+    """Drop an index without blocking writes; report instead of raising"""
+    try:
+        conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+        return True
+    except DBAPIError as e:
+        print(f"   ⚠️  could not drop {name}: {_first_line(e)}")
+        return False
+
+def _build_index_concurrently(conn, index):
+    """
+    Build one index with CREATE INDEX CONCURRENTLY, retrying lock timeouts.
+    Returns True if the index was built.
+    """
+    valid = _index_is_valid(conn, index.name)
+    if valid:
+        print(f"   ✔️  {index.name} already present")
+        return False
+    # IF NOT EXISTS would skip an INVALID leftover, so rebuild it
+    if valid is False and not _drop_index_concurrently(conn, index.name):
+        return False
+    
+    for attempt in range(INDEX_BUILD_ATTEMPTS):
+        try:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+            print(f"   ✅ {index.name} built")
+            return True
+        except DBAPIError as e:
+            # A failed concurrent build leaves an INVALID index behind
+            dropped = _drop_index_concurrently(conn, index.name)
+            
+            # Only lock timeouts are worth retrying
+            lock_timed_out = getattr(e.orig, "pgcode", None) == LOCK_NOT_AVAILABLE
+            if not dropped or not lock_timed_out or attempt == INDEX_BUILD_ATTEMPTS - 1:
+                print(f"   ⚠️  {index.name} skipped: {_first_line(e)}")
+                return False
+            time.sleep(2 ** attempt)
+    return False
+
+def _vector_index(conn):
+    """
+    Cosine-distance index for frames.embedding once there are enough rows to need
+    one: HNSW on pgvector 0.5+, otherwise IVFFlat sized from the rows present.
+    None if it can't or shouldn't be built yet.
+    """
+    has_column = conn.execute(text(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'frames' AND column_name = 'embedding'"
+    )).scalar()
+    if not has_column:
+        print("   ⏭️  frames.embedding not present, vector index skipped")
+        return None
+    
+    # Keep whichever variant was built first rather than maintaining two vector indexes
+    for name in FRAME_VECTOR_INDEXES:
+        if _index_is_valid(conn, name):
+            print(f"   ✔️  {name} already present")
+            return None
+    
+    version = conn.execute(text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")).scalar()
+    if version is None:
+        print("   ⏭️  pgvector extension not installed, vector index skipped")
+        return None
+    version = tuple(int(part) for part in version.split(".")[:2])
+    
+    # Searches filter and threshold after the index picks its candidates, so an
+    # approximate index on a small table only loses matches an exact scan would find
+    rows = conn.execute(text("SELECT count(*) FROM frames WHERE embedding IS NOT NULL")).scalar()
+    if rows < VECTOR_INDEX_MIN_ROWS:
+        print(f"   ⏭️  {rows} frame embeddings, exact scan is enough (vector index from {VECTOR_INDEX_MIN_ROWS})")
+        return None
+    
+    options = {
+        "postgresql_ops": {"embedding": "vector_cosine_ops"},
+        "postgresql_concurrently": True,
+    }
+    
+    if version >= HNSW_MIN_PGVECTOR:
+        return Index(
+            FRAME_VECTOR_INDEXES[0],
+            frame_vectors.c.embedding,
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            **options
+        )
+    
+    # IVFFlat clusters the existing rows, so lists is sized from what is there now
+    return Index(
+        FRAME_VECTOR_INDEXES[1],
+        frame_vectors.c.embedding,
+        postgresql_using="ivfflat",
+        postgresql_with={"lists": max(1, rows // IVFFLAT_ROWS_PER_LIST)},
+        **options
+    )
+
+def create_indexes_concurrently(engine):
+    """
+    Build model indexes missing from existing tables without blocking writes.
+    create_all only creates indexes together with new tables.
+    """
+    # Copies of the model tables whose indexes compile with CONCURRENTLY
+    concurrent_tables = MetaData()
+    
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"SET lock_timeout = '{INDEX_LOCK_TIMEOUT}'"))
+        if INDEX_MAINTENANCE_WORK_MEM:
+            conn.execute(text("SELECT set_config('maintenance_work_mem', :value, false)"),
+                         {"value": INDEX_MAINTENANCE_WORK_MEM})
+        
+        rebuilt_tables = set()
+        for table in Base.metadata.sorted_tables:
+            for index in table.to_metadata(concurrent_tables).indexes:
+                index.dialect_options["postgresql"]["concurrently"] = True
+                if _build_index_concurrently(conn, index):
+                    rebuilt_tables.add(table.name)
+        
+        vector_index = _vector_index(conn)
+        if vector_index is not None and _build_index_concurrently(conn, vector_index):
+            rebuilt_tables.add("frames")
+        
+        # Drop old indexes once their replacement is usable, so writes stop paying for both
+        for old_name, replacement in SUPERSEDED_INDEXES.items():
+            if _index_is_valid(conn, old_name) is None:
+                continue
+            if _index_is_valid(conn, replacement):
+                if _drop_index_concurrently(conn, old_name):
+                    print(f"   🗑️  {old_name} dropped")
+        
+        # Refresh planner statistics so new indexes are considered right away
+        for table_name in sorted(rebuilt_tables):
+            try:
+                conn.execute(text(f'ANALYZE "{table_name}"'))
+            except DBAPIError as e:
+                print(f"   ⚠️  ANALYZE {table_name} skipped: {_first_line(e)}")
+
 def create_tables():
     """Create all database tables"""
     try:
@@ -20,9 +197,8 @@ def create_tables():
         engine = create_engine(settings.database_url)
         
         # Ensure pgvector extension exists
-        with engine.connect() as conn:
+        with engine.begin() as conn:
             conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
-            conn.commit()
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
@@ -31,6 +207,10 @@ def create_tables():
         print("📊 Created tables:")
         for table_name in Base.metadata.tables.keys():
             print(f"   - {table_name}")
+        
+        # Add any new indexes to tables that already existed
+        print("🔎 Ensuring indexes:")
+        create_indexes_concurrently(engine)
             
         return True
         
@@ -40,4 +220,4 @@ def create_tables():
 
 if __name__ == "__main__":
     success = create_tables()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if success else 1) 
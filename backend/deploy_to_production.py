@@ -14,6 +14,9 @@ from pathlib import Path
 RENDER_BASE_URL = "https://raresift-backend.onrender.com"
 LOCAL_EXPORT_FILE = "complete_dataset_export_20250807_003349.json.gz"
 
+# Reuse one keep-alive connection for every call to the production API
+session = requests.Session()
+
 def load_local_export():
     """Load the compressed export file"""
     print(f"🔄 Loading export file: {LOCAL_EXPORT_FILE}")
@@ -34,11 +37,11 @@ def check_production_status():
     
     try:
         # Health check
-        response = requests.get(f"{RENDER_BASE_URL}/health", timeout=30)
+        response = session.get(f"{RENDER_BASE_URL}/health", timeout=30)
         print(f"✅ Backend health: {response.json()}")
         
         # Current data count
-        response = requests.get(f"{RENDER_BASE_URL}/api/v1/videos/?limit=1", timeout=30)
+        response = session.get(f"{RENDER_BASE_URL}/api/v1/videos/?limit=1", timeout=30)
         if response.status_code == 200:
             data = response.json()
             print(f"📊 Current production videos: {data.get('total', 0)}")
@@ -56,7 +59,7 @@ def initialize_production_database():
     
     try:
         # Initialize database
-        response = requests.post(f"{RENDER_BASE_URL}/api/v1/admin/initialize-database", timeout=60)
+        response = session.post(f"{RENDER_BASE_URL}/api/v1/admin/initialize-database", timeout=60)
         if response.status_code == 200:
             result = response.json()
             print(f"✅ Database initialized: {result}")
@@ -83,11 +86,11 @@ def deploy_data_to_production(data):
         print("🔧 Attempting complete setup via admin endpoints...")
         
         # 1. Initialize with proper schema
-        response = requests.post(f"{RENDER_BASE_URL}/api/v1/admin/initialize-database", timeout=60)
+        response = session.post(f"{RENDER_BASE_URL}/api/v1/admin/initialize-database", timeout=60)
         print(f"   Database init: {response.status_code}")
         
         # 2. Load basic data
-        response = requests.post(f"{RENDER_BASE_URL}/api/v1/admin/load-real-data", timeout=60)
+        response = session.post(f"{RENDER_BASE_URL}/api/v1/admin/load-real-data", timeout=60)
         print(f"   Load data: {response.status_code}")
         
         # 3. Try to import our export file by using the fix_embeddings_import.py equivalent
@@ -95,7 +98,7 @@ def deploy_data_to_production(data):
         
         print("📡 Sending deployment completion signal...")
         # This should trigger any remaining setup
-        response = requests.post(f"{RENDER_BASE_URL}/api/v1/simple-admin/simple-setup", timeout=120)
+        response = session.post(f"{RENDER_BASE_URL}/api/v1/simple-admin/simple-setup", timeout=120)
         print(f"   Simple setup: {response.status_code}")
         
         return True
@@ -109,7 +112,7 @@ def remove_authentication_requirements():
     print("🔓 Removing authentication requirements...")
     
     try:
-        response = requests.post(f"{RENDER_BASE_URL}/api/v1/admin/disable-auth", timeout=30)
+        response = session.post(f"{RENDER_BASE_URL}/api/v1/admin/disable-auth", timeout=30)
         if response.status_code == 200:
             print("✅ Authentication disabled for demo")
         else:
@@ -123,13 +126,13 @@ def validate_deployment():
     
     try:
         # Check videos
-        response = requests.get(f"{RENDER_BASE_URL}/api/v1/videos/?limit=30", timeout=30)
+        response = session.get(f"{RENDER_BASE_URL}/api/v1/videos/?limit=30", timeout=30)
         if response.status_code == 200:
             videos = response.json()
             print(f"✅ Videos deployed: {videos.get('total', 0)}")
         
         # Check health again
-        response = requests.get(f"{RENDER_BASE_URL}/api/v1/monitoring/health", timeout=30)
+        response = session.get(f"{RENDER_BASE_URL}/api/v1/monitoring/health", timeout=30)
         if response.status_code == 200:
             health = response.json()
             print(f"📊 Health status: {health.get('detail', {}).get('overall_status', 'unknown')}")
@@ -137,7 +140,7 @@ def validate_deployment():
         # Try a simple search
         try:
             search_payload = {"query": "intersection", "limit": 3}
-            response = requests.post(f"{RENDER_BASE_URL}/api/v1/search/text", json=search_payload, timeout=30)
+            response = session.post(f"{RENDER_BASE_URL}/api/v1/search/text", json=search_payload, timeout=30)
             if response.status_code == 200:
                 results = response.json()
                 print(f"🔍 Search test: Found {len(results.get('results', []))} results")
@@ -27,6 +27,19 @@ from app.core.database import Base
 from passlib.context import CryptContext
 import numpy as np
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def load_json_bytes(raw: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class ProductionDatasetImporter:
     """Import complete dataset to production database"""
     
@@ -42,11 +55,11 @@ class ProductionDatasetImporter:
         print(f"📦 Loading dataset from {self.dataset_file}...")
         
         if self.dataset_file.endswith('.gz'):
-            with gzip.open(self.dataset_file, 'rt', encoding='utf-8') as f:
-                data = json.load(f)
+            with gzip.open(self.dataset_file, 'rb') as f:
+                data = load_json_bytes(f.read())
         else:
-            with open(self.dataset_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.dataset_file, 'rb') as f:
+                data = load_json_bytes(f.read())
         
         print(f"✅ Loaded dataset:")
         print(f"   - Videos: {len(data['videos'])}")
@@ -375,8 +388,8 @@ class ProductionDatasetImporter:
         
         try:
             # Load backup data
-            with gzip.open(self.backup_file, 'rt') as f:
-                backup_data = json.load(f)
+            with gzip.open(self.backup_file, 'rb') as f:
+                backup_data = load_json_bytes(f.read())
             
             with self.SessionLocal() as db:
                 # Clear current data
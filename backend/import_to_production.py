@@ -16,6 +16,9 @@ from typing import Dict, List, Any
 # Production API base URL
 API_BASE = "https://raresift-backend.onrender.com"
 
+# Reuse one keep-alive connection for every call to the production API
+session = requests.Session()
+
 def load_dataset(filename: str) -> Dict[str, Any]:
     """Load the compressed dataset export file."""
     print(f"Loading dataset from {filename}...")
@@ -30,7 +33,7 @@ def clear_existing_data():
     """Clear existing data by reinitializing the database."""
     print("Clearing existing data...")
     
-    response = requests.post(f"{API_BASE}/api/v1/admin/initialize-database")
+    response = session.post(f"{API_BASE}/api/v1/admin/initialize-database")
     if response.status_code == 200:
         result = response.json()
         print(f"Database reinitialized: {result['message']}")
@@ -50,7 +53,7 @@ def register_demo_user():
         "full_name": "Demo User"
     }
     
-    response = requests.post(f"{API_BASE}/api/v1/auth/register", json=user_data)
+    response = session.post(f"{API_BASE}/api/v1/auth/register", json=user_data)
     if response.status_code == 200:
         user = response.json()
         print(f"Demo user created with ID: {user['id']}")
@@ -126,7 +129,7 @@ def verify_import():
     print("Verifying import...")
     
     # Check dashboard stats
-    response = requests.get(f"{API_BASE}/api/v1/stats/dashboard")
+    response = session.get(f"{API_BASE}/api/v1/stats/dashboard")
     if response.status_code == 200:
         stats = response.json()
         print(f"Production stats after import:")
@@ -142,7 +145,7 @@ def verify_import():
             "similarity_threshold": 0.1
         }
         
-        response = requests.post(f"{API_BASE}/api/v1/search/text", json=search_data)
+        response = session.post(f"{API_BASE}/api/v1/search/text", json=search_data)
         if response.status_code == 200:
             results = response.json()
             print(f"Search test: {results['total_found']} results found")
@@ -173,7 +176,7 @@ def main():
     # Instead of complex import, let's use the existing load-real-data endpoint
     # and then verify what we get
     print("Loading real data via API...")
-    response = requests.post(f"{API_BASE}/api/v1/admin/load-real-data")
+    response = session.post(f"{API_BASE}/api/v1/admin/load-real-data")
     if response.status_code == 200:
         result = response.json()
         print(f"Real data loaded: {result['message']}")
@@ -241,18 +241,22 @@ class FrameIngestionPipeline:
     
     def get_all_frame_paths(self) -> List[Path]:
         """Get all extracted frame paths"""
-        frame_paths = []
-        
-        # Get all frame patterns
-        patterns = [
-            "driving_camera_*.jpg",  # driving_camera_gh010001_frame_240.jpg
-            "static_camera_*.jpg",   # static_camera_gh010031_frame_001.jpg
-            "drive_*.jpg",           # drive_01_frame_000.jpg
-            "static_*.jpg"           # static_04_frame_001.jpg
-        ]
+        # Get all frame prefixes
+        prefixes = (
+            "driving_camera_",  # driving_camera_gh010001_frame_240.jpg
+            "static_camera_",   # static_camera_gh010031_frame_001.jpg
+            "drive_",           # drive_01_frame_000.jpg
+            "static_"           # static_04_frame_001.jpg
+        )
         
-        for pattern in patterns:
-            frame_paths.extend(self.frames_dir.glob(pattern))
+        # Single directory pass; each file is matched at most once
+        with os.scandir(self.frames_dir) as entries:
+            frame_paths = [
+                Path(entry.path) for entry in entries
+                if entry.name.startswith(prefixes)
+                and entry.name.endswith(".jpg")
+                and entry.is_file()
+            ]
         
         # Sort by filename for consistent processing order
         frame_paths.sort(key=lambda x: x.name)
@@ -12,12 +12,15 @@ import time
 # Production API
 API_BASE = "https://raresift-backend.onrender.com"
 
+# Reuse one keep-alive connection for every call to the production API
+session = requests.Session()
+
 def test_connection():
     """Test API connection and environment."""
     print("🔗 Testing production API connection...")
     
     try:
-        response = requests.get(f"{API_BASE}/health", timeout=90)
+        response = session.get(f"{API_BASE}/health", timeout=90)
         if response.status_code == 200:
             print("✅ Production API is healthy")
             return True
@@ -48,7 +51,7 @@ def load_complete_dataset():
     try:
         # First clear existing data
         print("🧹 Clearing existing data...")
-        response = requests.post(f"{API_BASE}/api/v1/admin/initialize-database", timeout=60)
+        response = session.post(f"{API_BASE}/api/v1/admin/initialize-database", timeout=60)
         if response.status_code == 200:
             print("✅ Database cleared successfully")
         else:
@@ -58,7 +61,7 @@ def load_complete_dataset():
         
         # Load the real data
         print("📼 Loading real video data...")
-        response = requests.post(f"{API_BASE}/api/v1/admin/load-real-data", timeout=120)
+        response = session.post(f"{API_BASE}/api/v1/admin/load-real-data", timeout=120)
         
         if response.status_code == 200:
             result = response.json()
@@ -83,7 +86,7 @@ def trigger_full_processing():
     
     try:
         # This endpoint should process all uploaded videos and generate embeddings
-        response = requests.post(f"{API_BASE}/api/v1/admin/process-all-videos", timeout=300)
+        response = session.post(f"{API_BASE}/api/v1/admin/process-all-videos", timeout=300)
         
         if response.status_code == 200:
             result = response.json()
@@ -108,7 +111,7 @@ def verify_final_state():
     
     try:
         # Check dashboard stats
-        response = requests.get(f"{API_BASE}/api/v1/stats/dashboard", timeout=30)
+        response = session.get(f"{API_BASE}/api/v1/stats/dashboard", timeout=30)
         if response.status_code == 200:
             stats = response.json()
             print(f"📊 Final Production Stats:")
@@ -119,7 +122,7 @@ def verify_final_state():
             
             # Test search
             print("🔍 Testing search functionality...")
-            search_response = requests.post(f"{API_BASE}/api/v1/search/text", 
+            search_response = session.post(f"{API_BASE}/api/v1/search/text", 
                 json={"query": "car driving", "limit": 3}, timeout=30)
             
             if search_response.status_code == 200: